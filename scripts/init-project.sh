@@ -39,6 +39,12 @@ if [ -d "$PLAYBOOK_DIR/templates/project/.claude" ]; then
     echo "✓ Created .claude/ directory"
 fi
 
+# Byte-compile hooks so each hook invocation skips recompiling its imports
+if [ -d "$PROJECT_PATH/.claude/hooks" ]; then
+    python3 -m compileall -q "$PROJECT_PATH/.claude/hooks" >/dev/null 2>&1 || true
+    echo "✓ Byte-compiled .claude/hooks/"
+fi
+
 # Create docs/sprints structure
 mkdir -p "$PROJECT_PATH/docs/sprints/0-backlog"
 mkdir -p "$PROJECT_PATH/docs/sprints/1-todo"
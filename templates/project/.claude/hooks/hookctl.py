@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Single entry point for the sprint hooks.
+
+Usage:
+    python .claude/hooks/hookctl.py pre-commit
+    python .claude/hooks/hookctl.py sprint-complete
+    python .claude/hooks/hookctl.py update-tests
+    python .claude/hooks/hookctl.py validate <command> [--threshold N]
+
+Only the module for the requested hook is imported, and run from the
+byte-compiled __pycache__ when the project bootstrap has run compileall.
+Exit codes are those of the dispatched hook.
+"""
+
+import argparse
+import importlib
+import sys
+
+HOOKS = {
+    "pre-commit": "pre_commit_check",
+    "sprint-complete": "sprint_complete_check",
+    "update-tests": "update_test_status",
+    "validate": "validate_step",
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Sprint hook dispatcher")
+    subparsers = parser.add_subparsers(dest="hook", required=True)
+    for name in HOOKS:
+        subparsers.add_parser(name, add_help=name != "validate")
+    args, extra = parser.parse_known_args()
+
+    module = importlib.import_module(HOOKS[args.hook])
+    if args.hook == "validate":
+        # validate_step has its own CLI; pass the remaining arguments through
+        return module.main(extra)
+    if extra:
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    return module.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
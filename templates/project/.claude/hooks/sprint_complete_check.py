@@ -8,22 +8,17 @@ Exit codes:
 - 2: Block completion (checks failed)
 """
 
-import json
 import subprocess
 import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-STATE_FILE = Path(".claude/sprint-state.json")
+from validate_step import ensure_cache_dir, find_secrets, load_state, run_pytest
 
 
 def run_tests() -> tuple[bool, str]:
     """Run tests and return (passed, output)."""
-    result = subprocess.run(
-        ["pytest", "tests/", "-q", "--tb=no"],
-        capture_output=True,
-        text=True
-    )
-    return result.returncode == 0, result.stdout
+    returncode, _, _, output, _, _ = run_pytest()
+    return returncode == 0, output
 
 
 def check_git_clean() -> tuple[bool, str]:
@@ -39,46 +34,39 @@ def check_git_clean() -> tuple[bool, str]:
 
 def check_no_secrets() -> tuple[bool, str]:
     """Check for hardcoded secrets."""
-    result = subprocess.run(
-        ["grep", "-rn", "-E",
-         r"(password|secret|api_key|token)\s*=\s*['\"][^'\"]+['\"]",
-         "src/", "--include=*.py"],
-        capture_output=True,
-        text=True
-    )
-
-    if result.returncode != 0:  # grep found nothing
-        return True, "No secrets found"
-
-    # Filter out test files and comments
-    suspicious = []
-    for line in result.stdout.split("\n"):
-        if line and "test" not in line.lower() and "#" not in line:
-            suspicious.append(line)
-
+    suspicious = find_secrets()
     if suspicious:
         return False, "\n".join(suspicious)
 
-    return True, "No secrets found (filtered)"
+    return True, "No secrets found"
 
 
 def main():
-    if not STATE_FILE.exists():
+    state = load_state()
+    if state is None:
         print("No active sprint")
         return 1
 
-    with open(STATE_FILE) as f:
-        state = json.load(f)
-
     sprint_num = state.get("sprint_number", "?")
     print(f"Running pre-flight checklist for Sprint {sprint_num}...")
     print()
 
     failures = []
 
+    # Checks 1-3 are independent, so run them concurrently. Create the
+    # (self-ignoring) hook cache dir first so pytest's reports can't show up
+    # as untracked files in the concurrent git status check.
+    ensure_cache_dir()
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        tests_future = executor.submit(run_tests)
+        git_future = executor.submit(check_git_clean)
+        secrets_future = executor.submit(check_no_secrets)
+        tests_pass, test_output = tests_future.result()
+        git_clean, git_output = git_future.result()
+        no_secrets, secrets_output = secrets_future.result()
+
     # 1. Tests passing
     print("1. Checking tests...", end=" ")
-    tests_pass, test_output = run_tests()
     if tests_pass:
         print("PASS")
     else:
@@ -87,7 +75,6 @@ def main():
 
     # 2. Git status clean
     print("2. Checking git status...", end=" ")
-    git_clean, git_output = check_git_clean()
     if git_clean:
         print("PASS")
     else:
@@ -96,7 +83,6 @@ def main():
 
     # 3. No hardcoded secrets
     print("3. Checking for secrets...", end=" ")
-    no_secrets, secrets_output = check_no_secrets()
     if no_secrets:
         print("PASS")
     else:
@@ -129,18 +115,15 @@ def main():
     print()
 
     if failures:
-        print("=" * 60)
-        print("PRE-FLIGHT CHECKLIST FAILED")
-        print("=" * 60)
-        print()
+        lines = ["=" * 60, "PRE-FLIGHT CHECKLIST FAILED", "=" * 60, ""]
         for name, detail in failures:
-            print(f"FAILED: {name}")
+            lines.append(f"FAILED: {name}")
             if detail:
-                for line in detail.split("\n")[:5]:  # Limit output
-                    print(f"  {line}")
-            print()
-        print("Sprint cannot be marked complete until all checks pass.")
-        print()
+                lines.extend(f"  {line}" for line in detail.split("\n", 5)[:5])  # Limit output
+            lines.append("")
+        lines += ["Sprint cannot be marked complete until all checks pass.", "", ""]
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.flush()
         return 2  # Block completion
 
     print("=" * 60)
@@ -3,61 +3,223 @@
 Utility functions for sprint step validation.
 
 Used by other hooks and can be imported for testing.
+
+Sprint state stays a plain JSON file because the sprint commands read and
+edit .claude/sprint-state.json directly. Data that is written often or grows
+is kept out of it: test runs go to a sidecar file and older completed steps
+to a per-sprint archive, so saving state stays small.
 """
 
+import functools
+import hashlib
 import json
-import subprocess
+import os
+import re
 import sys
+from collections import deque
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
 
 # Paths relative to project root
 STATE_FILE = Path(".claude/sprint-state.json")
 STEPS_FILE = Path(".claude/sprint-steps.json")
 
+# Only the most recent completed steps stay in the state file; save_state()
+# appends older entries to a per-sprint gzipped JSON-lines archive
+COMPLETED_STEPS_WINDOW = 20
+
+# Scratch space for machine-readable pytest/coverage reports
+HOOK_CACHE_DIR = Path(".claude/.cache")
+PYTEST_REPORT_FILE = HOOK_CACHE_DIR / "last-pytest.xml"
+COVERAGE_REPORT_FILE = HOOK_CACHE_DIR / "last-cov.json"
+# Project-root files that affect a test run, hashed into the green-run cache key
+_FINGERPRINT_ROOT_FILES = (
+    "conftest.py",
+    "pyproject.toml",
+    "setup.cfg",
+    "setup.py",
+    "pytest.ini",
+    "tox.ini",
+    ".coveragerc",
+    "requirements.txt",
+    "requirements-dev.txt",
+    "poetry.lock",
+    "uv.lock",
+    "Pipfile.lock",
+)
+# Latest test run, kept out of the state file so recording it never rewrites state.
+# Readers prefer its test_results and fall back to test_results in sprint state.
+TEST_STATUS_FILE = HOOK_CACHE_DIR / "sprint-test-status.json"
+
+# Summary line of human-readable pytest output (e.g. test-runner agent output):
+# "X passed, Y failed, Z skipped" or "X passed in Ys"
+_PYTEST_LINE = re.compile(
+    r"(?P<passed>\d+)\s+passed"
+    r"|(?P<failed>\d+)\s+failed"
+    r"|(?P<skipped>\d+)\s+skipped"
+    r"|(?P<errors>\d+)\s+error"
+)
+
+# Hardcoded credential assignment, e.g. api_key = "...". [ \t] keeps a match on
+# one line, and only the opening quote plus one character of the value is
+# matched: a Python string literal must close on the same line anyway, so
+# scanning to the closing quote adds backtracking work and no precision.
+_SECRET_RE = re.compile(
+    rb"(?:password|secret|api[_-]?key|token)[ \t]*=[ \t]*['\"][^'\"\n\r]",
+    re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=1)
+def hook_timestamp() -> str:
+    """ISO timestamp for this hook run.
+
+    Each hook is a fresh process, so the time is computed once and shared by
+    every record written during the run.
+    """
+    return datetime.now().isoformat()
+
+
+def parse_pytest_counts(output: str, tail_bytes: int = 4096) -> dict:
+    """Parse pytest summary output into passed/failed/skipped/errors counts.
+
+    The summary line comes last, so only the final ``tail_bytes`` (rounded
+    back to a line start) are scanned; the whole output is scanned only if
+    the tail holds no counts.
+    """
+    results = {"passed": 0, "failed": 0, "skipped": 0, "errors": 0}
+    start = output.rfind("\n", 0, max(len(output) - tail_bytes, 0)) + 1
+    matches = list(_PYTEST_LINE.finditer(output, start))
+    if not matches and start:
+        matches = _PYTEST_LINE.finditer(output)
+    for match in matches:
+        key = match.lastgroup
+        results[key] = int(match.group(key))
+    return results
+
 
 def load_state() -> Optional[dict]:
-    """Load sprint state from file."""
+    """Load sprint state from file.
+
+    Not cached: each hook loads state once per process, so a cache would
+    never hit and copying the cached dict costs more than the parse.
+    """
     if not STATE_FILE.exists():
         return None
     with open(STATE_FILE) as f:
         return json.load(f)
 
 
+def _write_json_atomic(path: Path, data: dict) -> None:
+    """Write JSON to a temp file and rename it over path.
+
+    An interrupted hook therefore never leaves a truncated file behind.
+    """
+    tmp = path.with_suffix(".json.tmp")
+    if orjson is not None:
+        tmp.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        tmp.write_text(json.dumps(data, indent=2))
+    os.replace(tmp, path)
+
+
 def save_state(state: dict) -> None:
-    """Save sprint state to file."""
-    with open(STATE_FILE, "w") as f:
-        json.dump(state, f, indent=2)
+    """Save sprint state to file.
+
+    completed_steps entries beyond the last COMPLETED_STEPS_WINDOW are moved
+    to the sprint's completed-steps archive first (trimming ``state`` in
+    place), so the state file stays small.
+    """
+    completed = state.get("completed_steps", [])
+    if len(completed) > COMPLETED_STEPS_WINDOW:
+        import gzip
+
+        ensure_cache_dir()
+        with gzip.open(completed_steps_archive(state), "at") as f:
+            f.writelines(json.dumps(entry) + "\n" for entry in completed[:-COMPLETED_STEPS_WINDOW])
+        state["completed_steps"] = completed[-COMPLETED_STEPS_WINDOW:]
+
+    _write_json_atomic(STATE_FILE, state)
+
+
+def load_test_status(state: dict) -> Optional[dict]:
+    """Load the latest test run recorded for this sprint, if any."""
+    if not TEST_STATUS_FILE.exists():
+        return None
+    with open(TEST_STATUS_FILE) as f:
+        status = json.load(f)
+    # Ignore a sidecar left over from a previous sprint
+    if status.get("sprint_number") != state.get("sprint_number"):
+        return None
+    return status
+
+
+def save_test_status(state: dict, results: dict, success: bool) -> None:
+    """Record a test run in the sidecar file, leaving the state file untouched.
+
+    ``success`` is the outcome of the run itself (pytest exit code 0), not
+    derived from the counts, which are empty when pytest exits early.
+    """
+    ensure_cache_dir()
+    _write_json_atomic(
+        TEST_STATUS_FILE,
+        {
+            "sprint_number": state.get("sprint_number"),
+            "test_results": results,
+            "tests_passing": success,
+            "updated_at": hook_timestamp(),
+        },
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _load_steps_cached(mtime_ns: int, path_str: str) -> dict:
+    """Parse the step definitions file and build lookup tables.
+
+    Keyed on mtime so edits invalidate the entry. Returns the raw
+    definitions plus a step_id -> step info map and a step_id -> next
+    step_id map.
+    """
+    with open(path_str) as f:
+        data = json.load(f)
+    order = data["step_order"]
+    return {
+        "raw": data,
+        "by_id": {
+            step["step"]: {**step, "phase_name": phase["name"], "phase": phase["phase"]}
+            for phase in data["phases"]
+            for step in phase["steps"]
+        },
+        "next": dict(zip(order, order[1:])),
+    }
+
+
+def _steps_index() -> dict:
+    """Return the cached step definitions and lookup tables."""
+    st = STEPS_FILE.stat()
+    return _load_steps_cached(st.st_mtime_ns, str(STEPS_FILE))
 
 
 def load_steps() -> dict:
-    """Load step definitions."""
-    with open(STEPS_FILE) as f:
-        return json.load(f)
+    """Load step definitions (cached, treat as read-only)."""
+    return _steps_index()["raw"]
 
 
 def get_step_info(step_id: str) -> Optional[dict]:
     """Get info for a specific step."""
-    steps = load_steps()
-    for phase in steps["phases"]:
-        for step in phase["steps"]:
-            if step["step"] == step_id:
-                return {**step, "phase_name": phase["name"], "phase": phase["phase"]}
-    return None
+    return _steps_index()["by_id"].get(step_id)
 
 
 def get_next_step(current_step: str) -> Optional[str]:
     """Get the next step in the workflow."""
-    steps = load_steps()
-    order = steps["step_order"]
-    try:
-        idx = order.index(current_step)
-        if idx + 1 < len(order):
-            return order[idx + 1]
-    except ValueError:
-        pass
-    return None
+    return _steps_index()["next"].get(current_step)
 
 
 def get_current_phase(step_id: str) -> int:
@@ -65,19 +227,52 @@ def get_current_phase(step_id: str) -> int:
     return int(step_id.split(".")[0])
 
 
+def completed_steps_archive(state: dict) -> Path:
+    """Path of the archive holding this sprint's older completed steps."""
+    return HOOK_CACHE_DIR / f"completed-steps-archive-{state.get('sprint_number', 'unknown')}.jsonl.gz"
+
+
+def _iter_archived_steps(state: dict) -> Iterator[dict]:
+    """Stream this sprint's archived completed steps, oldest first."""
+    archive = completed_steps_archive(state)
+    if archive.exists():
+        import gzip
+
+        with gzip.open(archive, "rt") as f:
+            for line in f:
+                yield json.loads(line)
+
+
+def iter_completed_steps(state: dict) -> Iterator[dict]:
+    """Yield every completed step oldest first, including archived entries.
+
+    An entry is yielded once even if it was archived more than once or is
+    still in completed_steps, e.g. when a save was interrupted after
+    archiving.
+    """
+    seen = set()
+    for entry in chain(_iter_archived_steps(state), state.get("completed_steps", [])):
+        key = json.dumps(entry, sort_keys=True)
+        if key not in seen:
+            seen.add(key)
+            yield entry
+
+
 def is_step_complete(step_id: str, state: dict) -> bool:
-    """Check if a step is in completed_steps."""
-    completed = [s["step"] for s in state.get("completed_steps", [])]
-    return step_id in completed
+    """Check if a step is in completed_steps (or its archive)."""
+    if any(s["step"] == step_id for s in state.get("completed_steps", [])):
+        return True
+    return any(s["step"] == step_id for s in _iter_archived_steps(state))
 
 
 def mark_step_complete(state: dict, step_id: str, output: str = "", agent: str = None) -> dict:
-    """Mark a step as complete in state."""
-    if "completed_steps" not in state:
-        state["completed_steps"] = []
+    """Mark a step as complete in state.
 
-    state["completed_steps"].append(
-        {"step": step_id, "completed_at": datetime.now().isoformat(), "output": output, "agent_used": agent}
+    Only mutates ``state``; save_state() persists it and archives older
+    completed_steps.
+    """
+    state.setdefault("completed_steps", []).append(
+        {"step": step_id, "completed_at": hook_timestamp(), "output": output, "agent_used": agent}
     )
 
     # Update current step to next
@@ -95,42 +290,168 @@ def mark_step_complete(state: dict, step_id: str, output: str = "", agent: str =
     else:
         # Sprint complete
         state["status"] = "complete"
-        state["completed_at"] = datetime.now().isoformat()
+        state["completed_at"] = hook_timestamp()
 
     return state
 
 
+def ensure_cache_dir() -> Path:
+    """Create the hook cache directory, git-ignoring its contents."""
+    HOOK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    gitignore = HOOK_CACHE_DIR / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text("*\n")
+    return HOOK_CACHE_DIR
+
+
+def stream_pytest(cmd: list[str], tail_lines: int = 200) -> tuple[int, str]:
+    """Run a command, keeping only the tail of its combined output.
+
+    stderr is merged into stdout and only the last ``tail_lines`` lines are
+    kept, so a verbose run is never buffered in full.
+
+    Returns:
+        Tuple of (returncode, output_tail)
+    """
+    import subprocess
+
+    tail = deque(maxlen=tail_lines)
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1) as proc:
+        tail.extend(proc.stdout)
+        returncode = proc.wait()
+    return returncode, "".join(tail)
+
+
+def read_junit_counts(path: Path = PYTEST_REPORT_FILE) -> Optional[dict]:
+    """Read passed/failed/skipped/errors counts from a pytest JUnit XML report.
+
+    Returns None if the report was not written.
+    """
+    if not path.exists():
+        return None
+    counts = {"passed": 0, "failed": 0, "skipped": 0, "errors": 0}
+
+    import xml.etree.ElementTree as ET
+
+    total = 0
+    for suite in ET.parse(path).getroot().iter("testsuite"):
+        total += int(suite.get("tests", 0))
+        counts["failed"] += int(suite.get("failures", 0))
+        counts["skipped"] += int(suite.get("skipped", 0))
+        counts["errors"] += int(suite.get("errors", 0))
+    counts["passed"] = total - counts["failed"] - counts["skipped"] - counts["errors"]
+    return counts
+
+
+def read_coverage_percentage(path: Path = COVERAGE_REPORT_FILE) -> float:
+    """Read total coverage percentage from a coverage.py JSON report."""
+    if not path.exists():
+        return 0.0
+    with open(path) as f:
+        return round(json.load(f)["totals"]["percent_covered"], 2)
+
+
+def _source_fingerprint() -> str:
+    """Hash path, size and mtime of src/, tests/ and the root test config.
+
+    The root files change what pytest collects or how it runs (conftest,
+    pytest/coverage settings, pinned dependencies), so they are part of the key.
+    """
+    digest = hashlib.sha1()
+    for name in _FINGERPRINT_ROOT_FILES:
+        if os.path.exists(name):
+            st = os.stat(name)
+            digest.update(f"{name}:{st.st_size}:{st.st_mtime_ns}\n".encode())
+    for top in ("src", "tests"):
+        for dirpath, dirnames, filenames in os.walk(top):
+            # pytest rewrites bytecode on every run; it must not bust the cache
+            dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+            for name in sorted(filenames):
+                st = os.stat(os.path.join(dirpath, name))
+                digest.update(f"{dirpath}/{name}:{st.st_size}:{st.st_mtime_ns}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+def run_pytest() -> tuple[int, dict, float, str, str, bool]:
+    """Run pytest with coverage, reusing the last green run if nothing changed.
+
+    Tests and coverage are collected in one invocation and read from the
+    JUnit XML and coverage JSON reports. A passing run is cached under
+    HOOK_CACHE_DIR keyed on a fingerprint of src/, tests/ and the root test
+    config, so the sprint-complete and pre-commit hooks share a single
+    test-suite run.
+    Failing runs are never cached. ``last_run`` is when pytest actually ran,
+    so a cached result keeps its original timestamp, and ``cached`` tells the
+    caller that pytest did not run at all.
+
+    Returns:
+        Tuple of (returncode, counts, coverage_percentage, output_tail, last_run, cached)
+    """
+    cache_file = ensure_cache_dir() / f"pytest-{_source_fingerprint()}.json"
+    if cache_file.exists():
+        with open(cache_file) as f:
+            cached = json.load(f)
+        # Entries written before last_run was recorded are treated as a miss
+        if "last_run" in cached:
+            return (
+                cached["returncode"],
+                cached["counts"],
+                cached["coverage_percentage"],
+                cached["output"],
+                cached["last_run"],
+                True,
+            )
+
+    # Never read a previous run's report if this one fails to write it
+    PYTEST_REPORT_FILE.unlink(missing_ok=True)
+    COVERAGE_REPORT_FILE.unlink(missing_ok=True)
+
+    last_run = hook_timestamp()
+    returncode, output = stream_pytest(
+        [
+            "pytest",
+            "tests/",
+            "-q",
+            "--tb=no",
+            f"--junitxml={PYTEST_REPORT_FILE}",
+            "--cov=src/corrdata",
+            f"--cov-report=json:{COVERAGE_REPORT_FILE}",
+        ]
+    )
+    counts = read_junit_counts()
+    if counts is None:
+        # pytest exited before writing its report (usage error, broken
+        # conftest, missing plugin); never record that as zero failures
+        counts = parse_pytest_counts(output)
+        if returncode != 0:
+            counts["errors"] = max(counts["errors"], 1)
+    coverage_percentage = read_coverage_percentage()
+
+    if returncode == 0:
+        for stale in HOOK_CACHE_DIR.glob("pytest-*.json"):
+            stale.unlink()
+        with open(cache_file, "w") as f:
+            json.dump(
+                {
+                    "returncode": returncode,
+                    "counts": counts,
+                    "coverage_percentage": coverage_percentage,
+                    "output": output,
+                    "last_run": last_run,
+                },
+                f,
+                indent=2,
+            )
+
+    return returncode, counts, coverage_percentage, output, last_run, False
+
+
 def run_tests() -> tuple[bool, dict]:
     """Run pytest and return (success, results)."""
-    result = subprocess.run(["pytest", "tests/", "-q", "--tb=no"], capture_output=True, text=True)
-
-    # Parse output for counts
-    output = result.stdout
-    passed = failed = skipped = 0
-
-    for line in output.split("\n"):
-        if "passed" in line:
-            parts = line.split()
-            for i, part in enumerate(parts):
-                if part == "passed" and i > 0:
-                    try:
-                        passed = int(parts[i - 1])
-                    except ValueError:
-                        pass
-                elif part == "failed" and i > 0:
-                    try:
-                        failed = int(parts[i - 1])
-                    except ValueError:
-                        pass
-                elif part == "skipped" and i > 0:
-                    try:
-                        skipped = int(parts[i - 1])
-                    except ValueError:
-                        pass
-
-    results = {"passed": passed, "failed": failed, "skipped": skipped, "last_run": datetime.now().isoformat()}
-
-    return result.returncode == 0, results
+    returncode, results, _, _, last_run, _ = run_pytest()
+    results["last_run"] = last_run
+
+    return returncode == 0, results
 
 
 def run_coverage(threshold: int = 75) -> tuple[bool, dict]:
@@ -142,30 +463,13 @@ def run_coverage(threshold: int = 75) -> tuple[bool, dict]:
     Returns:
         Tuple of (meets_threshold, results_dict)
     """
-    import re
-
-    result = subprocess.run(
-        ["pytest", "tests/", "-q", "--tb=no", "--cov=src/corrdata", "--cov-report=term"], capture_output=True, text=True
-    )
-
-    output = result.stdout + result.stderr
-    coverage_percentage = 0.0
-
-    # Parse coverage output - look for TOTAL line
-    # Format: TOTAL    1234    567    54%
-    for line in output.split("\n"):
-        if line.startswith("TOTAL") or "TOTAL" in line:
-            # Extract percentage from the line
-            match = re.search(r"(\d+)%", line)
-            if match:
-                coverage_percentage = float(match.group(1))
-                break
+    _, _, coverage_percentage, _, last_run, _ = run_pytest()
 
     results = {
         "coverage_percentage": coverage_percentage,
         "threshold": threshold,
         "meets_threshold": coverage_percentage >= threshold,
-        "last_run": datetime.now().isoformat(),
+        "last_run": last_run,
     }
 
     return coverage_percentage >= threshold, results
@@ -190,35 +494,72 @@ def check_coverage_gate(threshold: int = 75) -> tuple[bool, str]:
 
 def check_git_clean() -> bool:
     """Check if git working directory is clean."""
+    import subprocess
+
     result = subprocess.run(["git", "status", "--porcelain"], capture_output=True, text=True)
     return len(result.stdout.strip()) == 0
 
 
-def check_no_secrets() -> bool:
-    """Check for potential hardcoded secrets."""
-    patterns = [
-        r"password\s*=\s*['\"][^'\"]+['\"]",
-        r"api_key\s*=\s*['\"][^'\"]+['\"]",
-        r"secret\s*=\s*['\"][^'\"]+['\"]",
-        r"token\s*=\s*['\"][^'\"]+['\"]",
-    ]
+def _secret_scan_paths(root: Path) -> list[Path]:
+    """List non-test .py files under root."""
+    return [path for path in sorted(root.rglob("*.py")) if "test" not in str(path).lower()]
 
-    result = subprocess.run(
-        ["grep", "-rn", "-E", "|".join(patterns), "src/", "--include=*.py"], capture_output=True, text=True
-    )
 
-    # Filter out test files and comments
-    if result.returncode == 0:  # Found matches
-        for line in result.stdout.split("\n"):
-            if line and "test" not in line.lower() and not line.strip().startswith("#"):
-                return False
+def _scan_file_for_secrets(path: Path, first_only: bool = False) -> list[str]:
+    """Return suspicious lines in one file, stopping at the first if first_only."""
+    import mmap
 
-    return True
+    suspicious = []
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return suspicious  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for match in _SECRET_RE.finditer(mm):
+                start = mm.rfind(b"\n", 0, match.start()) + 1
+                end = mm.find(b"\n", match.end())
+                line = mm[start : end if end != -1 else len(mm)]
+                if b"test" in line.lower() or line.lstrip().startswith(b"#"):
+                    continue
+                lineno = mm[:start].count(b"\n") + 1
+                suspicious.append(f"{path}:{lineno}: {line.decode(errors='replace').strip()}")
+                if first_only:
+                    break
+    return suspicious
+
+
+def find_secrets(root: Path = Path("src")) -> list[str]:
+    """Scan .py files under root for potential hardcoded secrets.
+
+    Files are memory-mapped and matched in-process rather than via grep.
+    Matches in test code or on comment lines are ignored.
+
+    Returns:
+        List of suspicious matches formatted as "path:line: text"
+    """
+    suspicious = []
+    for path in _secret_scan_paths(root):
+        suspicious.extend(_scan_file_for_secrets(path))
+    return suspicious
+
+
+def check_no_secrets(root: Path = Path("src")) -> bool:
+    """Check for potential hardcoded secrets, stopping at the first hit.
+
+    Scans serially: the per-file work is a short mmap regex pass, so a
+    thread pool costs more than it saves.
+    """
+    return not any(_scan_file_for_secrets(path, first_only=True) for path in _secret_scan_paths(root))
 
 
 def validate_checklist(state: dict) -> tuple[bool, list[str]]:
     """Validate all pre-flight checklist items."""
-    checklist = state.get("pre_flight_checklist", {})
+    checklist = dict(state.get("pre_flight_checklist", {}))
+    # Test runs are recorded through the sidecar (update_test_status, and
+    # /sprint-complete pipes its rerun into it), so it is the latest result;
+    # the state flag is only a fallback for sprints that never recorded one
+    test_status = load_test_status(state)
+    if test_status is not None:
+        checklist["tests_passing"] = test_status["tests_passing"]
     failures = []
 
     # Required checks (must be True)
@@ -250,14 +591,14 @@ def validate_checklist(state: dict) -> tuple[bool, list[str]]:
     return len(failures) == 0, failures
 
 
-if __name__ == "__main__":
-    # CLI interface for testing
+def main(argv: Optional[list[str]] = None) -> int:
+    """CLI interface for testing."""
     import argparse
 
     parser = argparse.ArgumentParser(description="Sprint step validation utilities")
     parser.add_argument("command", choices=["status", "tests", "coverage", "git", "secrets", "checklist"])
     parser.add_argument("--threshold", type=int, default=85, help="Coverage threshold percentage")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.command == "status":
         state = load_state()
@@ -267,6 +608,7 @@ if __name__ == "__main__":
             print(f"Current step: {state['current_step']}")
         else:
             print("No active sprint")
+        return 0
 
     elif args.command == "tests":
         success, results = run_tests()
@@ -274,22 +616,22 @@ if __name__ == "__main__":
         print(f"  Passed: {results['passed']}")
         print(f"  Failed: {results['failed']}")
         print(f"  Skipped: {results['skipped']}")
-        sys.exit(0 if success else 1)
+        return 0 if success else 1
 
     elif args.command == "coverage":
         passes, message = check_coverage_gate(args.threshold)
         print(message)
-        sys.exit(0 if passes else 1)
+        return 0 if passes else 1
 
     elif args.command == "git":
         clean = check_git_clean()
         print(f"Git status: {'clean' if clean else 'dirty'}")
-        sys.exit(0 if clean else 1)
+        return 0 if clean else 1
 
     elif args.command == "secrets":
         clean = check_no_secrets()
         print(f"Secrets check: {'pass' if clean else 'POTENTIAL SECRETS FOUND'}")
-        sys.exit(0 if clean else 1)
+        return 0 if clean else 1
 
     elif args.command == "checklist":
         state = load_state()
@@ -298,7 +640,11 @@ if __name__ == "__main__":
             print(f"Checklist: {'PASS' if success else 'FAIL'}")
             for f in failures:
                 print(f"  - {f}")
-            sys.exit(0 if success else 1)
+            return 0 if success else 1
         else:
             print("No active sprint")
-            sys.exit(1)
+            return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())